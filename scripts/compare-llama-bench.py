@@ -5,6 +5,7 @@ import argparse
 import heapq
 import sys
 import os
+from collections import deque
 from glob import glob
 import sqlite3
 
@@ -146,12 +147,12 @@ def find_parent_in_data(commit):
 
 def get_all_parent_hexsha8s(commit):
     """Helper function to recursively get hexsha8 values for all parents of a commit."""
-    unvisited = [commit]
-    visited   = []
+    unvisited = deque([commit])
+    visited   = set()
 
     while unvisited:
-        current_commit = unvisited.pop(0)
-        visited.append(current_commit.hexsha[:8])
+        current_commit = unvisited.popleft()
+        visited.add(current_commit.hexsha[:8])
         for parent in current_commit.parents:
             if parent.hexsha[:8] not in visited:
                 unvisited.append(parent)